@@ -1,34 +1,103 @@
+import os
 import psutil
 import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# En localhost la conexión responde en microsegundos; un límite corto evita
+# que un puerto filtrado deje la verificación bloqueada indefinidamente
+PORT_TIMEOUT = 0.25
+
+# Tiempo máximo que se espera a las verificaciones; las que no terminen a
+# tiempo se reportan como desconocidas en lugar de detener el reporte
+CHECK_TIMEOUT = 2.0
+
+# Ventana mínima de muestreo de CPU; /proc/stat cuenta en pasos de 10 ms, así
+# que una ventana más corta da 0.0 o 100.0 en lugar de un valor real
+CPU_SAMPLE_WINDOW = 0.1
+
+# Linux recorta el nombre en /proc/<pid>/comm a 15 caracteres
+COMM_MAX_LEN = 15
+
+def status_icon(ok):
+    """Devuelve el indicador de estado; None significa estado desconocido."""
+    if ok is None:
+        return '⚪'
+    return '🟢' if ok else '🔴'
 
 def check_port(port):
     """Verifica si un puerto está en uso localmente."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(PORT_TIMEOUT)
         return s.connect_ex(('localhost', port)) == 0
 
-def monitor_app(app_name, app_port):
-    print(f"🔍 Monitoreando la aplicación: {app_name}")
+def linux_process_names():
+    """Lee los nombres de proceso directamente de /proc (solo Linux)."""
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            # Los nombres pueden no ser UTF-8 válido; como psutil, se
+            # decodifican con surrogateescape para no fallar
+            with open(f'/proc/{pid}/comm', encoding='utf-8',
+                      errors='surrogateescape') as f:
+                yield f.read().rstrip('\n')
+        except OSError:
+            # El proceso terminó o no hay permisos para leerlo
+            pass
 
-    # Verifica el proceso
-    is_running = any(
+def is_process_running(app_name):
+    """Verifica si existe un proceso con el nombre indicado."""
+    # En Linux leer /proc/<pid>/comm es mucho más barato que process_iter;
+    # los nombres largos están recortados, así que esos van por psutil
+    if sys.platform.startswith('linux') and len(app_name) < COMM_MAX_LEN:
+        return any(name == app_name for name in linux_process_names())
+    return any(
         p.info['name'] == app_name for p in psutil.process_iter(['name'])
     )
-    print(f"  Proceso: {'🟢' if is_running else '🔴'} {app_name}")
 
-    # Verifica el puerto
-    is_port_open = check_port(app_port)
-    print(f"  Puerto {app_port}: {'🟢' if is_port_open else '🔴'}")
+def monitor_app(app_name, app_port):
+    print(f"🔍 Monitoreando la aplicación: {app_name}")
+
+    # La primera llamada a cpu_percent() siempre devuelve 0.0; se inicia la
+    # muestra aquí y las verificaciones corren dentro de la ventana
+    psutil.cpu_percent(interval=None)
+    cpu_start = time.monotonic()
 
-    # Verifica recursos del sistema
-    cpu = psutil.cpu_percent()
+    # El proceso y el puerto se verifican en paralelo: ambas revisiones son
+    # de E/S, así que el tiempo total es el de la más lenta y no la suma
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        process_check = pool.submit(is_process_running, app_name)
+        port_check = pool.submit(check_port, app_port)
+        done, _ = wait([process_check, port_check], timeout=CHECK_TIMEOUT)
+        is_running = process_check.result() if process_check in done else None
+        is_port_open = port_check.result() if port_check in done else None
+    finally:
+        # Esto solo evita que el reporte espere: una verificación que siga
+        # corriendo no se detiene y Python la espera al terminar el programa
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Verifica recursos del sistema; solo se espera lo que falte de la ventana
+    time.sleep(max(0, CPU_SAMPLE_WINDOW - (time.monotonic() - cpu_start)))
+    cpu = psutil.cpu_percent(interval=None)
     mem = psutil.virtual_memory().percent
     disk = psutil.disk_usage('/').percent
-    print(f"\n📊 Recursos del sistema:")
-    print(f"  CPU: {cpu}% | Memoria: {mem}% | Disco: {disk}%")
+
+    # El reporte se arma completo y se escribe de una sola vez
+    lines = [
+        f"  Proceso: {status_icon(is_running)} {app_name}",
+        f"  Puerto {app_port}: {status_icon(is_port_open)}",
+        "\n📊 Recursos del sistema:",
+        f"  CPU: {cpu}% | Memoria: {mem}% | Disco: {disk}%",
+    ]
 
     # Alertas críticas
     if disk > 85:
-        print("\n❌ ¡Urgente! Disco casi lleno (>85%).")
+        lines.append("\n❌ ¡Urgente! Disco casi lleno (>85%).")
+
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     monitor_app(app_name="python.exe", app_port=5000)